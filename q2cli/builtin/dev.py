@@ -8,9 +8,12 @@
 
 import click
 
+import q2cli.util
 from q2cli.click.command import ToolCommand, ToolGroupCommand
 
 _COMBO_METAVAR = 'ARTIFACT/VISUALIZATION'
+_EXISTING_FILE = click.Path(exists=True, file_okay=True, dir_okay=False,
+                            readable=True)
 
 
 @click.group(help='Utilities for developers and advanced users.',
@@ -75,28 +78,24 @@ import_theme_help = \
              short_help='Install new command line theme.',
              help=import_theme_help,
              cls=ToolCommand)
-@click.option('--theme', required=True,
-              type=click.Path(exists=True, file_okay=True,
-                              dir_okay=False, readable=True),
+@click.option('--theme', required=True, type=_EXISTING_FILE,
               help='Path to file containing new theme info')
 def import_theme(theme):
-    import os
     import shutil
     from configparser import Error
 
-    import q2cli.util
     from q2cli.core.config import CONFIG
 
+    # The theme is parsed into its own styles so that a parsing error part
+    # way through the file leaves the current styling untouched.
+    styles = CONFIG.get_editable_styles()
     try:
-        CONFIG.parse_file(theme)
+        CONFIG.parse_file(theme, styles=styles)
     except Error as e:
-        # If they tried to change [error] in a valid manner before we hit our
-        # parsing error, we don't want to use their imported error settings
-        CONFIG.styles = CONFIG.get_default_styles()
         header = 'Something went wrong while parsing your theme: '
         q2cli.util.exit_with_error(e, header=header, traceback=None)
-    shutil.copy(theme, os.path.join(q2cli.util.get_app_dir(),
-                'cli-colors.theme'))
+    CONFIG.styles = styles
+    shutil.copy(theme, CONFIG.path)
 
 
 @dev.command(name='export-default-theme',
@@ -109,13 +108,17 @@ def import_theme(theme):
                               dir_okay=False, readable=True),
               help='Path to output the config to')
 def export_default_theme(output_path):
-    import configparser
     from q2cli.core.config import CONFIG
 
-    parser = configparser.ConfigParser()
-    parser.read_dict(CONFIG.get_default_styles())
+    # The default styles are a flat mapping of selectors to stylings, so the
+    # INI text is written directly, in the same layout ConfigParser.write
+    # would produce.
     with open(output_path, 'w') as fh:
-        parser.write(fh)
+        for selector, styling in CONFIG.get_default_styles().items():
+            fh.write(f'[{selector}]\n')
+            for key, value in styling.items():
+                fh.write(f'{key} = {value}\n')
+            fh.write('\n')
 
 
 def abort_if_false(ctx, param, value):
@@ -133,14 +136,14 @@ def abort_if_false(ctx, param, value):
               prompt='Are you sure you want to reset your theme?')
 def reset_theme():
     import os
-    import q2cli.util
 
     path = os.path.join(q2cli.util.get_app_dir(), 'cli-colors.theme')
-    if os.path.exists(path):
+    try:
         os.unlink(path)
-        click.echo('Theme reset.')
-    else:
+    except FileNotFoundError:
         click.echo('Theme was already default.')
+    else:
+        click.echo('Theme reset.')
 
 
 @dev.command(name='assert-result-type',
@@ -154,7 +157,6 @@ def reset_theme():
 @click.option('--qiime-type', required=True,
               help='QIIME 2 data type.')
 def assert_result_type(input_path, qiime_type):
-    import q2cli.util
     import qiime2.sdk
     from os.path import isdir
     from q2cli.core.config import CONFIG
@@ -188,17 +190,27 @@ def assert_result_type(input_path, qiime_type):
              help='Uses regex to check that the provided expression is present'
                   ' in input file. Intended for developer testing.',
              cls=ToolCommand)
-@click.argument('input-path', type=click.Path(exists=True, file_okay=True,
-                dir_okay=False, readable=True),
-                metavar=_COMBO_METAVAR)
+@click.argument('input-path', type=_EXISTING_FILE, metavar=_COMBO_METAVAR)
 @click.option('--zip-data-path', required=True,
               help='The path within the zipped Result\'s data/'
                    ' directory that should be searched.')
 @click.option('--expression', required=True,
               help='The Python regular expression to match.')
 def assert_result_data(input_path, zip_data_path, expression):
+    import os
     import re
-    import q2cli.util
+    import mmap
+    import itertools
+
+    try:
+        pattern = re.compile(expression, flags=re.MULTILINE)
+    except re.error as e:
+        header = 'There was a problem compiling the expression (%s):' % \
+                expression
+        q2cli.util.exit_with_error(e, header=header, traceback=None)
+
+    # The framework is only imported once the expression is known to be
+    # valid, so a bad expression fails fast.
     import qiime2.sdk
     from q2cli.core.config import CONFIG
 
@@ -212,9 +224,12 @@ def assert_result_data(input_path, zip_data_path, expression):
         q2cli.util.exit_with_error(e, header=header)
 
     try:
-        hits = sorted(result._archiver.data_dir.glob(zip_data_path))
+        # Only two matches are needed to tell whether the path is unique, so
+        # the glob is not exhausted unless the error needs every match.
+        data_dir = result._archiver.data_dir
+        hits = list(itertools.islice(data_dir.glob(zip_data_path), 2))
         if len(hits) != 1:
-            data_dir = result._archiver.data_dir
+            hits = sorted(data_dir.glob(zip_data_path))
             all_fps = sorted(data_dir.glob('**/*'))
             all_fps = [x.relative_to(data_dir).name for x in all_fps]
             raise ValueError('Value provided for zip_data_path (%s) did not '
@@ -227,9 +242,23 @@ def assert_result_data(input_path, zip_data_path, expression):
         q2cli.util.exit_with_error(e, header=header)
 
     try:
-        target = hits[0].read_text()
-        match = re.search(expression, target, flags=re.MULTILINE)
-        if match is None:
+        # An ASCII expression without any regex metacharacters (which include
+        # whitespace and line breaks) is a plain substring. Its bytes are the
+        # same in any ASCII-compatible encoding and unaffected by newline
+        # translation, so it is found with a byte search through a read-only
+        # mapping instead of decoding the file. Empty files can't be mapped.
+        # Anything else is matched against the decoded text as before.
+        if expression.isascii() and re.escape(expression) == expression:
+            with open(hits[0], 'rb') as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    found = not expression
+                else:
+                    with mmap.mmap(fh.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mm:
+                        found = mm.find(expression.encode('ascii')) != -1
+        else:
+            found = pattern.search(hits[0].read_text()) is not None
+        if not found:
             raise AssertionError('Expression %r not found in %s.' %
                                  (expression, hits[0]))
     except Exception as e:
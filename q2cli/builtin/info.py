@@ -8,32 +8,33 @@
 
 import click
 
+import q2cli.util
 from q2cli.click.command import ToolCommand
 
 
-def _echo_version():
+def _version_lines():
     import sys
     import qiime2
     import q2cli
 
     pyver = sys.version_info
-    click.echo('Python version: %d.%d.%d' %
-               (pyver.major, pyver.minor, pyver.micro))
-    click.echo('QIIME 2 release: %s' % qiime2.__release__)
-    click.echo('QIIME 2 version: %s' % qiime2.__version__)
-    click.echo('q2cli version: %s' % q2cli.__version__)
+    return [f'Python version: {pyver.major}.{pyver.minor}.{pyver.micro}',
+            f'QIIME 2 release: {qiime2.__release__}',
+            f'QIIME 2 version: {qiime2.__version__}',
+            f'q2cli version: {q2cli.__version__}']
 
 
-def _echo_plugins():
+def _plugin_lines():
     import q2cli.core.cache
 
     plugins = q2cli.core.cache.CACHE.plugins
     if plugins:
-        for name, plugin in sorted(plugins.items()):
-            click.echo('%s: %s' % (name, plugin['version']))
+        return [f'{name}: {version}' for name, version in
+                sorted((name, plugin['version'])
+                       for name, plugin in plugins.items())]
     else:
-        click.secho('No plugins are currently installed.\nYou can browse '
-                    'the official QIIME 2 plugins at https://qiime2.org')
+        return ['No plugins are currently installed.\nYou can browse '
+                'the official QIIME 2 plugins at https://qiime2.org']
 
 
 @click.command(help='Display information about current deployment.',
@@ -46,47 +47,51 @@ def _echo_plugins():
               help='The level of detail to be used for displaying the '
                    'configuration summary.')
 def info(config_level):
-    import q2cli.util
-    # This import improves performance for repeated _echo_plugins
-    import q2cli.core.cache
-    from qiime2.sdk.parallel_config import (get_vendored_config,
-                                            load_config_from_dict)
-    from tomlkit import dumps
+    # The report is assembled as a list of lines and written with a single
+    # echo at the end, rather than one write per line.
+    out = []
 
-    click.secho('System versions', fg='green')
-    _echo_version()
-    click.secho('\nInstalled plugins', fg='green')
-    _echo_plugins()
+    out.append(click.style('System versions', fg='green'))
+    out.extend(_version_lines())
+    out.append(click.style('\nInstalled plugins', fg='green'))
+    out.extend(_plugin_lines())
 
-    click.secho('\nApplication config directory', fg='green')
-    click.secho(q2cli.util.get_app_dir())
+    out.append(click.style('\nApplication config directory', fg='green'))
+    out.append(q2cli.util.get_app_dir())
 
     if config_level > 0:
-        click.secho('\nConfig', fg='green')
+        from qiime2.sdk.parallel_config import get_vendored_config
+
+        out.append(click.style('\nConfig', fg='green'))
 
         config, action_executor_mapping, vendored_source = \
             get_vendored_config()
 
-        click.secho(f'Config Source: {vendored_source}')
+        out.append(f'Config Source: {vendored_source}')
 
         if action_executor_mapping:
             config['parsl.executor_mapping'] = action_executor_mapping
 
         if config_level > 1:
             if config_level == 2:
+                from tomlkit import dumps
+
                 config = dumps(config)
             elif config_level == 3:
+                from qiime2.sdk.parallel_config import load_config_from_dict
+
                 config['parsl'], _ = load_config_from_dict(config)
 
-            click.secho(f'\n{config}')
+            out.append(f'\n{config}')
 
-    click.secho('\nGetting help', fg='green')
-    click.secho('To get help with QIIME 2, visit https://qiime2.org')
+    out.append(click.style('\nGetting help', fg='green'))
+    out.append('To get help with QIIME 2, visit https://qiime2.org')
 
     if config_level:
-        click.secho('To get help with configuring and/or understanding '
-                    'QIIME 2 parallelization, visit '
-                    'https://use.qiime2.org/en/latest/references/'
-                    'parallel-configuration.html')
+        out.append('To get help with configuring and/or understanding '
+                   'QIIME 2 parallelization, visit '
+                   'https://use.qiime2.org/en/latest/references/'
+                   'parallel-configuration.html')
 
-    click.secho('\n')
+    out.append('\n')
+    click.echo('\n'.join(out))
@@ -43,39 +43,55 @@ def tools():
               help='Format which the data should be exported as. '
               'This option cannot be used with Visualizations')
 def export_data(input_path, output_path, output_format):
+    import shutil
     import qiime2.util
     import qiime2.sdk
-    import distutils
     from q2cli.core.config import CONFIG
     result = qiime2.sdk.Result.load(input_path)
     if output_format is None:
+        result.export_data(output_path)
         if isinstance(result, qiime2.sdk.Artifact):
             output_format = result.format.__name__
         else:
             output_format = 'Visualization'
-        result.export_data(output_path)
+        output_type = 'file' if os.path.isfile(output_path) else 'directory'
     else:
         if isinstance(result, qiime2.sdk.Visualization):
             error = '--output-format cannot be used with visualizations'
             click.echo(CONFIG.cfg_style('error', error), err=True)
             click.get_current_context().exit(1)
         else:
-            source = result.view(qiime2.sdk.parse_format(output_format))
-            if os.path.isfile(str(source)):
+            source = str(result.view(qiime2.sdk.parse_format(output_format)))
+            if os.path.isfile(source):
+                output_dir = os.path.dirname(output_path)
                 if os.path.isfile(output_path):
                     os.remove(output_path)
-                elif os.path.dirname(output_path) == '':
+                elif output_dir == '':
                     # This allows the user to pass a filename as a path if they
                     # want their output in the current working directory
                     output_path = os.path.join('.', output_path)
-                if os.path.dirname(output_path) != '':
+                if output_dir != '':
                     # create directory (recursively) if it doesn't exist yet
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                qiime2.util.duplicate(str(source), output_path)
+                    os.makedirs(output_dir, exist_ok=True)
+                qiime2.util.duplicate(source, output_path)
+                output_type = 'file'
             else:
-                distutils.dir_util.copy_tree(str(source), output_path)
+                # The view is copied file by file so that only missing
+                # directories are created; shutil.copytree would also copy
+                # the view's (temporary, private) directory permissions onto
+                # an existing output directory. Like distutils' copy_tree,
+                # existing files are replaced rather than written into.
+                for dirpath, _, filenames in os.walk(source, followlinks=True):
+                    target_dir = os.path.normpath(os.path.join(
+                        output_path, os.path.relpath(dirpath, source)))
+                    os.makedirs(target_dir, exist_ok=True)
+                    for filename in filenames:
+                        target = os.path.join(target_dir, filename)
+                        if os.path.lexists(target):
+                            os.remove(target)
+                        shutil.copy2(os.path.join(dirpath, filename), target)
+                output_type = 'directory'
 
-    output_type = 'file' if os.path.isfile(output_path) else 'directory'
     success = 'Exported %s as %s to %s %s' % (input_path, output_format,
                                               output_type, output_path)
     click.echo(CONFIG.cfg_style('success', success))
@@ -83,29 +99,33 @@ def export_data(input_path, output_path, output_format):
 
 def _print_descriptions(descriptions, tsv):
     if tsv:
+        lines = []
         for value, description in descriptions.items():
-            click.echo(f"{value}\t", nl=False)
             if description:
-                click.echo(_deformat_description(description))
-            else:
-                click.echo()
+                description = _deformat_description(description)
+            lines.append(f"{value}\t{description or ''}")
+        if lines:
+            click.echo('\n'.join(lines))
     else:
         import textwrap
         tabsize = 8
+        wrapper = textwrap.TextWrapper(width=72-tabsize,
+                                       initial_indent='\t',
+                                       subsequent_indent='\t',
+                                       tabsize=tabsize)
+        # Styling is applied inline so the listing can be echoed at once;
+        # click.echo strips it again when stdout is not a terminal.
+        lines = []
         for value, description in descriptions.items():
-            click.secho(value, bold=True)
+            lines.append(click.style(value, bold=True))
             if description:
                 description = _deformat_description(description)
-                wrapped_description = textwrap.wrap(description,
-                                                    width=72-tabsize,
-                                                    initial_indent='\t',
-                                                    subsequent_indent='\t',
-                                                    tabsize=tabsize)
-                for line in wrapped_description:
-                    click.echo(f"{line}")
+                lines.extend(wrapper.wrap(description))
             else:
-                click.secho("\tNo description", italic=True)
-            click.echo()
+                lines.append(click.style("\tNo description", italic=True))
+            lines.append('')
+        if lines:
+            click.echo('\n'.join(lines))
 
 
 def _deformat_description(description):
@@ -124,6 +144,10 @@ def _get_matches(words, possibilities, strict=False):
 
     matches = set()
     num_possibilities = len(possibilities)
+    if cutoff != 1:
+        # lowercase once for the substring search, not once per query word
+        lowered = [(possibility.lower(), possibility)
+                   for possibility in possibilities]
     for word in words:
         matches.update(get_close_matches(word,
                                          possibilities,
@@ -131,9 +155,9 @@ def _get_matches(words, possibilities, strict=False):
                                          cutoff=cutoff))
         # substring search
         if cutoff != 1:
-            for possibility in possibilities:
-                if word.lower() in possibility.lower():
-                    matches.add(possibility)
+            word = word.lower()
+            matches.update(possibility for lower, possibility in lowered
+                           if word in lower)
 
     return list(matches)
 
@@ -200,7 +224,7 @@ def show_formats(queries, importable, exportable, strict, tsv):
     descriptions = {}
     for match in matches:
         docstring = portable_formats[match].format.__doc__
-        first_docstring_line = docstring.split('\n\n')[0].strip() \
+        first_docstring_line = docstring.partition('\n\n')[0].strip() \
             if docstring else ''
         descriptions[match] = first_docstring_line
 
@@ -293,36 +317,31 @@ def peek(paths, tsv):
         COLUMN_UUID = "UUID"
         COLUMN_DATA_FORMAT = "Data Format"
 
-        filename_width = max([len(p) for p in paths]
-                             + [len(COLUMN_FILENAME)])
-        type_width = max([len(i.type) for i in metadatas.values()]
-                         + [len(COLUMN_TYPE)])
-        uuid_width = max([len(i.uuid) for i in metadatas.values()]
-                         + [len(COLUMN_UUID)])
-        data_format_width = \
-            max([len(i.format) if i.format is not None else 0
-                 for i in metadatas.values()] + [len(COLUMN_DATA_FORMAT)])
+        rows = [(path, m.type, m.uuid, m.format or 'N/A')
+                for path, m in metadatas.items()]
+        _, types, uuids, data_formats = zip(*rows)
+
+        filename_width = max(max(map(len, paths)), len(COLUMN_FILENAME))
+        type_width = max(max(map(len, types)), len(COLUMN_TYPE))
+        uuid_width = max(max(map(len, uuids)), len(COLUMN_UUID))
+        data_format_width = max(max(map(len, data_formats)),
+                                len(COLUMN_DATA_FORMAT))
 
         padding = 2
-        format_string = f"{{f:<{filename_width + padding}}} " + \
-                        f"{{t:<{type_width + padding}}} " + \
-                        f"{{u:<{uuid_width + padding}}} " + \
-                        f"{{d:<{data_format_width + padding}}}"
+        formatter = (f"{{f:<{filename_width + padding}}} "
+                     f"{{t:<{type_width + padding}}} "
+                     f"{{u:<{uuid_width + padding}}} "
+                     f"{{d:<{data_format_width + padding}}}").format
 
         click.secho(
-            format_string.format(
+            formatter(
                 f=COLUMN_FILENAME,
                 t=COLUMN_TYPE,
                 u=COLUMN_UUID,
                 d=COLUMN_DATA_FORMAT),
             bold=True, fg="green")
-        for path, m in metadatas.items():
-            click.echo(
-                format_string.format(
-                    f=path,
-                    t=m.type,
-                    u=m.uuid,
-                    d=(m.format if m.format is not None else 'N/A')))
+        for path, type_, uuid, data_format in rows:
+            click.echo(formatter(f=path, t=type_, u=uuid, d=data_format))
 
 
 _COLUMN_TYPES = ['categorical', 'numeric']
@@ -368,18 +387,18 @@ def cast_metadata(paths, cast, output_file, ignore_extra,
     cast_dict = {}
     try:
         for casting in cast:
-            if ':' not in casting:
+            col, sep, type_ = casting.partition(':')
+            if not sep:
                 raise click.BadParameter(
                     message=f'Missing `:` in --cast {casting}',
                     param_hint='cast')
-            splitter = casting.split(':')
-            if len(splitter) != 2:
+            if ':' in type_:
+                splitter = casting.split(':')
                 raise click.BadParameter(
                     message=f'Incorrect number of fields in --cast {casting}.'
                             f' Observed {len(splitter)}'
                             f' {tuple(splitter)}, expected 2.',
                     param_hint='cast')
-            col, type_ = splitter
             if col in cast_dict:
                 raise click.BadParameter(
                     message=(f'Column name "{col}" appears in cast more than'
@@ -465,41 +484,40 @@ def inspect_metadata(paths, tsv, failure):
 
     COLUMN_NAME = "COLUMN NAME"
     COLUMN_TYPE = "TYPE"
-    max_name_len = max([len(n) for n in metadata.columns]
-                       + [len(COLUMN_NAME)])
-    max_type_len = max([len(p.type) for p in metadata.columns.values()]
-                       + [len(COLUMN_TYPE)])
 
     if tsv:
         import csv
         import io
 
-        def formatter(*row):
-            # This is gross, but less gross than robust TSV writing.
-            with io.StringIO() as fh:
-                writer = csv.writer(fh, dialect='excel-tab', lineterminator='')
-                writer.writerow(row)
-                return fh.getvalue()
-    else:
-        formatter = ("{0:>%d}  {1:%d}" % (max_name_len, max_type_len)).format
-
-    click.secho(formatter(COLUMN_NAME, COLUMN_TYPE), bold=True)
-    if not tsv:
-        click.secho(formatter("=" * max_name_len, "=" * max_type_len),
-                    bold=True)
+        click.secho(f"{COLUMN_NAME}\t{COLUMN_TYPE}", bold=True)
+        # All rows go through one writer into one buffer, which is echoed
+        # in a single write.
+        with io.StringIO() as fh:
+            writer = csv.writer(fh, dialect='excel-tab', lineterminator='\n')
+            writer.writerows((name, props.type)
+                             for name, props in metadata.columns.items())
+            click.echo(fh.getvalue(), nl=False)
+        return
 
-    for name, props in metadata.columns.items():
-        click.echo(formatter(name, props.type))
+    max_name_len = max(max(map(len, metadata.columns), default=0),
+                       len(COLUMN_NAME))
+    max_type_len = max(max((len(p.type) for p in metadata.columns.values()),
+                           default=0),
+                       len(COLUMN_TYPE))
+    formatter = ("{0:>%d}  {1:%d}" % (max_name_len, max_type_len)).format
+    label_formatter = ("{0:>%d}  " % max_name_len).format
+    rule = formatter("=" * max_name_len, "=" * max_type_len)
 
-    if not tsv:
-        click.secho(formatter("=" * max_name_len, "=" * max_type_len),
-                    bold=True)
-        click.secho(("{0:>%d}  " % max_name_len).format("IDS:"),
-                    bold=True, nl=False)
-        click.echo(metadata.id_count)
-        click.secho(("{0:>%d}  " % max_name_len).format("COLUMNS:"),
-                    bold=True, nl=False)
-        click.echo(metadata.column_count)
+    click.secho(formatter(COLUMN_NAME, COLUMN_TYPE), bold=True)
+    click.secho(rule, bold=True)
+    if metadata.columns:
+        click.echo('\n'.join(formatter(name, props.type)
+                             for name, props in metadata.columns.items()))
+    click.secho(rule, bold=True)
+    click.secho(label_formatter("IDS:"), bold=True, nl=False)
+    click.echo(metadata.id_count)
+    click.secho(label_formatter("COLUMNS:"), bold=True, nl=False)
+    click.echo(metadata.column_count)
 
 
 def _merge_metadata(paths):
@@ -524,9 +542,6 @@ def _merge_metadata(paths):
 def view(visualization_path, index_extension):
     # Guard headless envs from having to import anything large
     import sys
-    from qiime2 import Visualization
-    from q2cli.util import _load_input
-    from q2cli.core.config import CONFIG
     if not os.getenv("DISPLAY") and sys.platform != "darwin":
         raise click.UsageError(
             'Visualization viewing is currently not supported in headless '
@@ -534,6 +549,10 @@ def view(visualization_path, index_extension):
             'https://view.qiime2.org, or move the Visualization to an '
             'environment with a display and view it with `qiime tools view`.')
 
+    from qiime2 import Visualization
+    from q2cli.util import _load_input
+    from q2cli.core.config import CONFIG
+
     if index_extension.startswith('.'):
         index_extension = index_extension[1:]
 
@@ -558,11 +577,11 @@ def view(visualization_path, index_extension):
                                         'failed while attempting to open '
                                         f'{index_path}'), err=True)
         else:
+            click.echo(
+                "Press the 'q' key, Control-C, or Control-D to quit. This "
+                "view may no longer be accessible or work correctly after "
+                "quitting.", nl=False)
             while True:
-                click.echo(
-                    "Press the 'q' key, Control-C, or Control-D to quit. This "
-                    "view may no longer be accessible or work correctly after "
-                    "quitting.", nl=False)
                 # There is currently a bug in click.getchar where translation
                 # of Control-C and Control-D into KeyboardInterrupt and
                 # EOFError (respectively) does not work on Python 3. The code
@@ -572,11 +591,11 @@ def view(visualization_path, index_extension):
                 # https://github.com/pallets/click/issues/583
                 try:
                     char = click.getchar()
-                    click.echo()
                     if char in {'q', '\x03', '\x04'}:
                         break
                 except (KeyboardInterrupt, EOFError):
                     break
+            click.echo()
 
 
 @tools.command(short_help="Extract a QIIME 2 Artifact or Visualization "
@@ -599,15 +618,20 @@ def view(visualization_path, index_extension):
               default=os.getcwd())
 def extract(input_path, output_path):
     import zipfile
+
+    error = ('%s is not a valid QIIME 2 Result. Only QIIME 2 Artifacts and '
+             'Visualizations can be extracted.' % input_path)
+    # Reject files that aren't zip archives before importing the framework.
+    if not zipfile.is_zipfile(input_path):
+        raise click.BadParameter(error)
+
     import qiime2.sdk
     from q2cli.core.config import CONFIG
 
     try:
         extracted_dir = qiime2.sdk.Result.extract(input_path, output_path)
     except (zipfile.BadZipFile, ValueError):
-        raise click.BadParameter(
-            '%s is not a valid QIIME 2 Result. Only QIIME 2 Artifacts and '
-            'Visualizations can be extracted.' % input_path)
+        raise click.BadParameter(error)
     else:
         success = 'Extracted %s to directory %s' % (input_path, extracted_dir)
         click.echo(CONFIG.cfg_style('success', success))
@@ -664,7 +688,6 @@ def validate(path, level):
                 metavar=_COMBO_METAVAR)
 def citations(path):
     import qiime2.sdk
-    import io
     from q2cli.core.config import CONFIG
     ctx = click.get_current_context()
 
@@ -675,9 +698,11 @@ def citations(path):
         q2cli.util.exit_with_error(e, header=header)
 
     if result.citations:
-        with io.StringIO() as fh:
-            result.citations.save(fh)
-            click.echo(fh.getvalue(), nl=False)
+        # The BibTeX is written straight to stdout rather than collected in
+        # memory first.
+        stdout = click.get_text_stream('stdout')
+        result.citations.save(stdout)
+        stdout.flush()
         ctx.exit(0)
     else:
         click.echo(CONFIG.cfg_style('problem', 'No citations found.'),
@@ -926,9 +951,10 @@ def cache_status(cache):
                         (key, str(Result.peek(_cache.data / data))))
                 elif 'pool' in key_values:
                     pool = key_values['pool']
+                    with os.scandir(_cache.pools / pool) as entries:
+                        size = sum(1 for _ in entries)
                     pool_output.append(
-                        'pool: %s -> size = %s' %
-                        (key, str(len(os.listdir(_cache.pools / pool)))))
+                        'pool: %s -> size = %s' % (key, size))
     except Exception as e:
         header = "There was a problem getting the status of the cache at " \
                  "path '%s':" % cache
@@ -8,20 +8,18 @@
 
 import click
 
-import q2cli.builtin.dev
-import q2cli.builtin.info
-import q2cli.builtin.tools
-
 from q2cli.click.command import BaseCommandMixin
-from q2cli.core.config import CONFIG
 
 
 class RootCommand(BaseCommandMixin, click.MultiCommand):
     """This class defers to either the PluginCommand or the builtin cmds"""
+    # Builtin commands are stored as (module, attribute) pairs and only
+    # imported when requested, so invoking a plugin command doesn't pay for
+    # importing every builtin module.
     _builtin_commands = {
-        'info': q2cli.builtin.info.info,
-        'tools': q2cli.builtin.tools.tools,
-        'dev': q2cli.builtin.dev.dev
+        'info': ('q2cli.builtin.info', 'info'),
+        'tools': ('q2cli.builtin.tools', 'tools'),
+        'dev': ('q2cli.builtin.dev', 'dev')
     }
 
     def __init__(self, *args, **kwargs):
@@ -44,6 +42,8 @@ class RootCommand(BaseCommandMixin, click.MultiCommand):
                 categories.append((command, '--m-%s-column' % param_name))
 
         if invalid_chars or categories:
+            from q2cli.core.config import CONFIG
+
             if invalid_chars:
                 msg = ("Error: Detected invalid character in: %s\nVerify the "
                        "correct quotes or dashes (ASCII) are being used."
@@ -94,12 +94,16 @@ class RootCommand(BaseCommandMixin, click.MultiCommand):
 
     def get_command(self, ctx, name):
         if name in self._builtin_commands:
-            return self._builtin_commands[name]
+            import importlib
+
+            module, attr = self._builtin_commands[name]
+            return getattr(importlib.import_module(module), attr)
 
         try:
             plugin = self._plugin_lookup[name]
         except KeyError:
             from q2cli.util import get_close_matches
+            from q2cli.core.config import CONFIG
 
             possibilities = get_close_matches(name, self._plugin_lookup)
             if len(possibilities) == 1:
@@ -226,6 +230,7 @@ class PluginCommand(BaseCommandMixin, click.MultiCommand):
             action = self._action_lookup[name]
         except KeyError:
             from q2cli.util import get_close_matches
+            from q2cli.core.config import CONFIG
 
             possibilities = get_close_matches(name, self._action_lookup)
             if len(possibilities) == 1:
@@ -251,6 +256,7 @@ class ActionCommand(BaseCommandMixin, click.Command):
     def __init__(self, name, plugin, action):
         import q2cli.util
         import q2cli.click.type
+        from q2cli.core.config import CONFIG
 
         self.plugin = plugin
         self.action = action
@@ -379,8 +385,10 @@ class ActionCommand(BaseCommandMixin, click.Command):
         from qiime2.core.cache import Cache
         from qiime2.sdk import ResultCollection
 
+        import q2cli.util
         from q2cli.util import (output_in_cache, _get_cache_path_and_key,
                                 get_default_recycle_pool)
+        from q2cli.core.config import CONFIG
         from q2cli.core.artifact_cache_global import (
             get_used_artifact_cache, unset_used_artifact_cache)
 
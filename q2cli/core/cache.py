@@ -40,7 +40,9 @@ class DeploymentCache:
     improves performance by only reading and/or refreshing the cache a
     single time during its lifetime. Having two instances could, for example,
     trigger two cache refreshes if Q2CLIDEV is set. To support these use-cases,
-    a module-level `CACHE` variable stores a single instance of this class.
+    a module-level `CACHE` variable stores a single instance of this class. It
+    is created on first access, so importing this module does not touch the
+    cache.
 
     """
 
@@ -131,22 +133,29 @@ class DeploymentCache:
     # `_get_cached_state`.
 
     def _get_current_requirements(self):
-        """Includes installed versions of q2cli and QIIME 2 plugins."""
+        """Includes installed versions of q2cli and QIIME 2 plugins.
+
+        Requirements are returned as `name==version` strings.
+
+        """
         import os
-        import pkg_resources
+        import importlib.metadata
         import q2cli
 
-        reqs = {
-            pkg_resources.Requirement.parse('q2cli == %s' % q2cli.__version__)
-        }
+        reqs = {'q2cli==%s' % q2cli.__version__}
 
         # A distribution (i.e. Python package) can have multiple plugins, where
-        # each plugin is its own entry point. A distribution's `Requirement` is
-        # hashable, and the `set` is used to exclude duplicates. Thus, we only
-        # gather the set of requirements for all installed Python packages
-        # containing one or more plugins. It is not necessary to track
-        # individual plugin names and versions in order to determine if the
-        # cache is outdated.
+        # each plugin is its own entry point. The `set` is used to exclude
+        # duplicates. Thus, we only gather the set of requirements for all
+        # installed Python packages containing one or more plugins. It is not
+        # necessary to track individual plugin names and versions in order to
+        # determine if the cache is outdated.
+        #
+        # Entry points are read with `importlib.metadata` rather than
+        # `pkg_resources`, which builds a working set of every installed
+        # distribution on import. Distributions are walked directly because
+        # `EntryPoint.dist` and `entry_points(group=...)` aren't available on
+        # every supported Python.
         #
         # TODO: this code is (more or less) copied from
         # `qiime2.sdk.PluginManager.iter_entry_points`. Importing QIIME is
@@ -158,20 +167,20 @@ class DeploymentCache:
         # for ep in qiime2.sdk.PluginManager.iter_entry_points():
         #     reqs.add(ep.dist.as_requirement())
         #
-        for entry_point in pkg_resources.iter_entry_points(
-                group='qiime2.plugins'):
-            if 'QIIMETEST' in os.environ:
-                if entry_point.name in ('dummy-plugin', 'other-plugin'):
-                    reqs.add(entry_point.dist.as_requirement())
-            else:
-                if entry_point.name not in ('dummy-plugin', 'other-plugin'):
-                    reqs.add(entry_point.dist.as_requirement())
+        testing = 'QIIMETEST' in os.environ
+        for dist in importlib.metadata.distributions():
+            for entry_point in dist.entry_points:
+                if entry_point.group != 'qiime2.plugins':
+                    continue
+                is_test_plugin = \
+                    entry_point.name in ('dummy-plugin', 'other-plugin')
+                if is_test_plugin == testing:
+                    reqs.add('%s==%s' % (dist.metadata['Name'], dist.version))
 
         return reqs
 
     def _get_cached_requirements(self):
         import os.path
-        import pkg_resources
 
         path = os.path.join(self._cache_dir, 'requirements.txt')
 
@@ -181,13 +190,13 @@ class DeploymentCache:
             # contain q2cli.
             return set()
         else:
+            # The cached requirements were written by
+            # `_cache_current_state` in the same normalized form that
+            # `_get_current_requirements` produces, so the lines can be
+            # compared as strings without parsing them. Unreadable or
+            # hand-edited contents simply won't match and trigger a refresh.
             with open(path, 'r') as fh:
-                contents = fh.read()
-            try:
-                return set(pkg_resources.parse_requirements(contents))
-            except pkg_resources.RequirementParseError:
-                # Unreadable cached requirements, trigger a cache refresh.
-                return set()
+                return {line for line in fh.read().splitlines() if line}
 
     def _cache_current_state(self, requirements):
         import json
@@ -215,8 +224,8 @@ class DeploymentCache:
                     }
                 return super().default(obj)
 
-        with open(path, 'w') as fh:
-            json.dump(state, fh, cls=Q2JSONEncoder)
+        self._write_atomically(
+            path, lambda fh: json.dump(state, fh, cls=Q2JSONEncoder))
 
         q2cli.core.completion.write_bash_completion_script(
             state['plugins'], q2cli.util.get_completion_path())
@@ -228,15 +237,37 @@ class DeploymentCache:
         # trigger this cache refresh, avoiding this bug:
         #     https://github.com/qiime2/q2cli/issues/88
         path = os.path.join(cache_dir, 'requirements.txt')
-        with open(path, 'w') as fh:
-            for req in requirements:
-                # `str(Requirement)` is the recommended way to format a
-                # `Requirement` that can be read with `Requirement.parse`.
-                fh.write(str(req))
-                fh.write('\n')
+
+        # Requirements are sorted so the file contents are deterministic for a
+        # given deployment, and written in a single call.
+        payload = ''.join(req + '\n' for req in sorted(requirements))
+        self._write_atomically(path, lambda fh: fh.write(payload))
 
         self._refreshed = True
 
+    def _write_atomically(self, path, write):
+        """Write a cache file so that readers never see it half-written.
+
+        `write` is called with a temporary file next to `path`, which then
+        replaces `path`. Concurrent `qiime` processes refreshing the cache
+        at the same time may each replace the file, but each replacement is a
+        complete file.
+
+        """
+        import os
+
+        # The temporary name is unique per process, and unlike `mkstemp` the
+        # file is created with the usual permissions for the user's umask.
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            with open(tmp_path, 'w') as fh:
+                write(fh)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
     def _get_current_state(self):
         """Get current CLI state as an object that is serializable as JSON.
 
@@ -281,5 +312,12 @@ class DeploymentCache:
         return lines
 
 
-# Singleton. Import and use this instance as necessary.
-CACHE = DeploymentCache()
+def __getattr__(name):
+    # Singleton. Access `CACHE` as necessary; the instance is created (and the
+    # cache read or refreshed) the first time it is accessed, then stored as a
+    # module global so later lookups don't come through here.
+    if name == 'CACHE':
+        global CACHE
+        CACHE = DeploymentCache()
+        return CACHE
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
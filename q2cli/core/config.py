@@ -7,7 +7,6 @@
 # ----------------------------------------------------------------------------
 
 import os
-import configparser
 
 import click
 
@@ -29,6 +28,16 @@ class CLIConfig():
                       'false': False,
                       't': True,
                       'f': False}
+    DEFAULT_STYLES = {'option': {'fg': 'bright_blue'},
+                      'type': {'fg': 'green'},
+                      'default_arg': {'fg': 'magenta'},
+                      'command': {'fg': 'bright_blue'},
+                      'emphasis': {'underline': True},
+                      'problem': {'fg': 'yellow'},
+                      'warning': {'fg': 'yellow', 'bold': True},
+                      'error': {'fg': 'red', 'bold': True},
+                      'required': {'underline': True},
+                      'success': {'fg': 'green'}}
 
     def __init__(self):
         if os.path.exists(self.path):
@@ -50,17 +59,11 @@ class CLIConfig():
         else:
             self.styles = self.get_default_styles()
 
+    # Each selector's styling is copied out by `get_default_styles` because
+    # `parse_file` mutates `self.styles` in place.
     def get_default_styles(self):
-        return {'option': {'fg': 'bright_blue'},
-                'type': {'fg': 'green'},
-                'default_arg': {'fg': 'magenta'},
-                'command': {'fg': 'bright_blue'},
-                'emphasis': {'underline': True},
-                'problem': {'fg': 'yellow'},
-                'warning': {'fg': 'yellow', 'bold': True},
-                'error': {'fg': 'red', 'bold': True},
-                'required': {'underline': True},
-                'success': {'fg': 'green'}}
+        return {selector: dict(styling)
+                for selector, styling in self.DEFAULT_STYLES.items()}
 
     # This maintains the default colors while getting rid of all the default
     # styling modifiers so what the user puts in their file is all they'll see
@@ -77,11 +80,19 @@ class CLIConfig():
                 'success': {}}
 
     def _build_error(self, current, valid_list, valid_string):
+        import configparser
+
         valids = ', '.join(valid_list)
         raise configparser.Error(f'{current!r} is not a {valid_string}. The '
                                  f'{valid_string}s are:\n{valids}')
 
-    def parse_file(self, fp):
+    # Styles are written into `styles` when given, so a theme can be
+    # validated without touching `self.styles` until it has fully parsed.
+    def parse_file(self, fp, styles=None):
+        import configparser
+
+        if styles is None:
+            styles = self.styles
         if os.path.exists(fp):
             parser = configparser.ConfigParser()
             parser.read(fp)
@@ -106,7 +117,7 @@ class CLIConfig():
                             self._build_error(val_user, self.VALID_BOOLEANS,
                                               'valid boolean')
                         val = self.VALID_BOOLEANS[val]
-                    self.styles[selector][styling] = val
+                    styles[selector][styling] = val
         else:
             raise configparser.Error(f'{fp!r} is not a valid filepath.')
 
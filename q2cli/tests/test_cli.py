@@ -7,6 +7,7 @@
 # ----------------------------------------------------------------------------
 
 import os.path
+import sys
 import unittest
 import contextlib
 import unittest.mock
@@ -14,6 +15,7 @@ import tempfile
 import shutil
 import click
 import errno
+import subprocess
 
 from click.testing import CliRunner
 from qiime2.core.cache import get_cache
@@ -1118,6 +1120,31 @@ class TestCollectionSupport(unittest.TestCase):
                       result.output)
 
 
+class TestImportTime(unittest.TestCase):
+    # `qiime --help` (like tab completion) runs on every interactive session.
+    # Once the deployment cache is warm, it lists plugins from the cache and
+    # must not pull in the framework or its scientific stack.
+    def test_help_avoids_heavy_imports(self):
+        env = {k: v for k, v in os.environ.items() if k != 'Q2CLIDEV'}
+        cmd = [sys.executable, '-m', 'q2cli', '--help']
+        # The first run may refresh the cache, which does import QIIME 2.
+        subprocess.run(cmd, env=env, capture_output=True, check=True)
+
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime'] + cmd[1:],
+            env=env, capture_output=True, text=True, check=True)
+
+        imported = set()
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:'):
+                imported.add(line.rsplit('|', 1)[-1].strip())
+
+        self.assertIn('q2cli.core.cache', imported)
+        for module in ('qiime2', 'qiime2.sdk', 'pandas', 'numpy',
+                       'pkg_resources'):
+            self.assertNotIn(module, imported)
+
+
 @contextlib.contextmanager
 def modified_environ(*remove, **update):
     """
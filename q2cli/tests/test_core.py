@@ -7,6 +7,7 @@
 # ----------------------------------------------------------------------------
 
 import os.path
+import json
 import pathlib
 import shutil
 import tempfile
@@ -36,6 +37,7 @@ import q2cli.util
 import q2cli.builtin.info
 import q2cli.builtin.tools
 from q2cli.commands import RootCommand
+from q2cli.core.cache import DeploymentCache
 from q2cli.core.config import CLIConfig
 from q2cli.core.usage import ReplayCLIUsage, CLIUsageVariable
 
@@ -194,6 +196,20 @@ class TestOption(unittest.TestCase):
             config.parse_file('Path')
 
 
+class TestDeploymentCache(unittest.TestCase):
+    def test_unreadable_state_file_is_refreshed(self):
+        expected = DeploymentCache().plugins
+        state_path = os.path.join(q2cli.util.get_cache_dir(), 'state.json')
+        with open(state_path, 'w') as fh:
+            fh.write('{"plugins": ')
+
+        cache = DeploymentCache()
+
+        self.assertEqual(cache.plugins, expected)
+        with open(state_path) as fh:
+            self.assertEqual(json.load(fh)['plugins'].keys(), expected.keys())
+
+
 class ReplayCLIUsageTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -68,6 +68,11 @@ class TestDev(unittest.TestCase):
                   self.generated_config])
         self.assertEqual(result.exit_code, 0)
 
+        self.parser.read(self.generated_config)
+        self.assertEqual(self.parser['error']['fg'], 'red')
+        self.assertEqual(self.parser['error']['bold'], 'True')
+        self.assertEqual(self.parser['emphasis']['underline'], 'True')
+
     def test_reset_theme(self):
         result = self.runner.invoke(
             dev, ['reset-theme', '--yes'])
@@ -188,3 +193,44 @@ class TestDev(unittest.TestCase):
         self.assertRegex(result.stderr,
                          r'Expression \'foobar\''
                          r' not found in .*\/data\/mapping\.tsv\.')
+
+    def test_assert_result_data_invalid_expression(self):
+        result = self.runner.invoke(dev, ['assert-result-data',
+                                          self.mapping_path,
+                                          '--zip-data-path', 'mapping.tsv',
+                                          '--expression', '(42'])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('problem compiling the expression ((42)',
+                      result.stderr)
+
+    def test_assert_result_data_regex_expression(self):
+        result = self.runner.invoke(dev, ['assert-result-data',
+                                          self.mapping_path,
+                                          '--zip-data-path', 'mapping.tsv',
+                                          '--expression', r'^foo\s+4\d$'])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(r'"^foo\s+4\d$" was found in mapping.tsv',
+                      result.stdout)
+
+    def test_assert_result_data_crlf_line_endings(self):
+        data_dir = os.path.join(self.tempdir, 'crlf')
+        os.mkdir(data_dir)
+        with open(os.path.join(data_dir, 'mapping.tsv'), 'wb') as fh:
+            fh.write(b'foo\t42\r\n')
+        crlf_path = os.path.join(self.tempdir, 'crlf.qza')
+        crlf = Artifact.import_data('Mapping', data_dir,
+                                    view_type='MappingDirectoryFormat')
+        crlf.save(crlf_path)
+
+        for expression in (r'^foo\s+4\d$', '42'):
+            result = self.runner.invoke(dev, ['assert-result-data',
+                                              crlf_path,
+                                              '--zip-data-path',
+                                              'mapping.tsv',
+                                              '--expression', expression])
+
+            self.assertEqual(result.exit_code, 0, result.stderr)
+            self.assertIn('"%s" was found in mapping.tsv' % expression,
+                          result.stdout)
@@ -9,6 +9,7 @@
 import os
 import gc
 import re
+import stat
 import shutil
 import unittest
 from unittest.mock import patch
@@ -271,6 +272,31 @@ class TestInspectMetadata(unittest.TestCase):
         self.assertEqual(result.exit_code, 0)
         self.assertTrue(os.path.isdir(output_path))
 
+    def test_export_to_dir_w_format_existing_dir(self):
+        output_path = os.path.join(self.tempdir, 'output')
+        os.mkdir(output_path)
+        os.chmod(output_path, 0o2775)
+        result = self.runner.invoke(tools, [
+            'export', '--input-path', self.ints1, '--output-path', output_path,
+            '--output-format', 'IntSequenceDirectoryFormat'
+        ])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('ints.txt', os.listdir(output_path))
+        self.assertEqual(stat.S_IMODE(os.stat(output_path).st_mode), 0o2775)
+
+    def test_export_to_dir_w_format_twice(self):
+        output_path = os.path.join(self.tempdir, 'output')
+        for _ in range(2):
+            result = self.runner.invoke(tools, [
+                'export', '--input-path', self.ints1,
+                '--output-path', output_path,
+                '--output-format', 'IntSequenceDirectoryFormat'
+            ])
+
+            self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('ints.txt', os.listdir(output_path))
+
     def test_export_to_dir_no_format(self):
         output_path = os.path.join(self.tempdir, 'output')
         self.runner.invoke(tools, [
@@ -378,6 +404,18 @@ class TestInspectMetadata(unittest.TestCase):
         success = 'Extracted %s to directory %s' % (self.ints1, self.tempdir)
         self.assertIn(success, result.output)
 
+    def test_extract_not_an_archive(self):
+        not_a_zip = os.path.join(self.tempdir, 'not-a-zip.qza')
+        with open(not_a_zip, 'w') as fh:
+            fh.write('This is not a QIIME 2 Result.\n')
+
+        result = self.runner.invoke(tools, [
+            'extract', '--input-path', not_a_zip,
+            '--output-path', self.tempdir
+            ])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('is not a valid QIIME 2 Result', result.output)
+
     def test_import_from_directory_without_format_success_message(self):
         output_path = os.path.join(self.tempdir, 'output.qza')
         result = self.runner.invoke(tools, [